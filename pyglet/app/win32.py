@@ -5,8 +5,24 @@ from .base import PlatformEventLoop
 from pyglet.libs.win32 import _kernel32, _user32, types, constants
 from pyglet.libs.win32.types import *
 
+# Functions called on every step. Their prototypes are declared in
+# pyglet.libs.win32; binding them here avoids repeated library lookups.
+_MsgWaitForMultipleObjectsEx = _user32.MsgWaitForMultipleObjectsEx
+_PeekMessageW = _user32.PeekMessageW
+_TranslateMessage = _user32.TranslateMessage
+_DispatchMessageW = _user32.DispatchMessageW
+_PostThreadMessageW = _user32.PostThreadMessageW
+_SetWaitableTimer = _kernel32.SetWaitableTimer
+_CancelWaitableTimer = _kernel32.CancelWaitableTimer
+_GetQueueStatus = _user32.GetQueueStatus
+
+# MsgWaitForMultipleObjectsEx waits on at most MAXIMUM_WAIT_OBJECTS - 1 handles.
+_max_wait_handles = constants.MAXIMUM_WAIT_OBJECTS - 1
+
 
 class Win32EventLoop(PlatformEventLoop):
+    _max_messages_per_step = 64
+
     def __init__(self):
         super().__init__()
 
@@ -15,46 +31,120 @@ class Win32EventLoop(PlatformEventLoop):
         # Force immediate creation of an event queue on this thread -- note
         # that since event loop is created on pyglet.app import, whatever
         # imports pyglet.app _must_ own the main run loop.
-        msg = types.MSG()
-        _user32.PeekMessageW(ctypes.byref(msg), 0,
+        # The same MSG structure is reused for every message pumped by step().
+        self._msg = types.MSG()
+        self._msg_ref = ctypes.byref(self._msg)
+        _user32.PeekMessageW(self._msg_ref, 0,
                              constants.WM_USER, constants.WM_USER,
                              constants.PM_NOREMOVE)
 
         self._event_thread = _kernel32.GetCurrentThreadId()
 
+        # High resolution waitable timer (Windows 10 1803+). When available, it
+        # is used for step timeouts instead of the millisecond wait timeout,
+        # which removes the need to raise the system-wide timer resolution.
+        self._hr_timer = _kernel32.CreateWaitableTimerExW(None, None,
+                                                          constants.CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                                                          constants.TIMER_ALL_ACCESS)
+        self._hr_timer_armed = False
+
+        # Set while a wake-up message is probably posted but not yet seen by
+        # step(). May be stale; it only suppresses redundant notifications.
+        self._wake_pending = False
+        # Set when the posted event queue may be non-empty.
+        self._have_posted_events = False
+
+        # Handles are written in place into a preallocated array sized for the
+        # most handles MsgWaitForMultipleObjectsEx accepts.
         self._wait_objects = []
+        self._wait_object_index = {}
+        self._wait_objects_array = (HANDLE * _max_wait_handles)()
         self._recreate_wait_objects_array()
 
         self._timer_proc = types.TIMERPROC(self._timer_proc_func)
         self._timer = _user32.SetTimer(0, 0, constants.USER_TIMER_MAXIMUM, self._timer_proc)
         self._timer_func = None
+        self._timer_interval = constants.USER_TIMER_MAXIMUM
 
         # Windows Multimedia timer precision functions
         # https://learn.microsoft.com/en-us/windows/win32/api/timeapi/nf-timeapi-timebeginperiod
         self._winmm = ctypes.windll.LoadLibrary('winmm')
+        self._winmm.timeGetDevCaps.restype = UINT
+        self._winmm.timeGetDevCaps.argtypes = [POINTER(TIMECAPS), UINT]
+        self._winmm.timeBeginPeriod.restype = UINT
+        self._winmm.timeBeginPeriod.argtypes = [UINT]
+        self._winmm.timeEndPeriod.restype = UINT
+        self._winmm.timeEndPeriod.argtypes = [UINT]
         timecaps = TIMECAPS()
         self._winmm.timeGetDevCaps(ctypes.byref(timecaps), ctypes.sizeof(timecaps))
         self._timer_precision = min(max(1, timecaps.wPeriodMin), timecaps.wPeriodMax)
 
+    def __del__(self):
+        # The module globals may already be gone at interpreter shutdown, or
+        # __init__ may have failed early. Pass silently in either case.
+        try:
+            if self._hr_timer:
+                _kernel32.CloseHandle(self._hr_timer)
+                self._hr_timer = None
+        except:  # XXX  Avoid a NoneType/AttributeError during teardown.
+            pass
+
+    def post_event(self, dispatcher, event, *args):
+        # Same as the base class, but also raises the _have_posted_events flag.
+        # The flag must be raised after queueing and before waking the loop,
+        # so that step() can never skip an event it was woken for.
+        self._event_queue.put((dispatcher, event, args))
+        self._have_posted_events = True
+        self.notify()
+
+    def dispatch_posted_events(self):
+        # Clear the flag before draining; see post_event.
+        self._have_posted_events = False
+        super().dispatch_posted_events()
+
     def add_wait_object(self, obj, func):
+        # The high resolution timer, when present, takes one of the handles.
+        limit = _max_wait_handles - (1 if self._hr_timer else 0)
+        if len(self._wait_objects) >= limit:
+            raise RuntimeError(f'Cannot wait on more than {limit} objects at once')
+
+        # An object may be added more than once, so track all its positions.
+        self._wait_object_index.setdefault(obj, []).append(len(self._wait_objects))
         self._wait_objects.append((obj, func))
         self._recreate_wait_objects_array()
 
     def remove_wait_object(self, obj):
-        for i, (_object, _) in enumerate(self._wait_objects):
-            if obj == _object:
-                del self._wait_objects[i]
-                break
+        positions = self._wait_object_index.get(obj)
+        if not positions:
+            return
+
+        # Positions are kept in the order the entries were added, so the
+        # earliest added entry is removed first, as before.
+        index = positions.pop(0)
+        if not positions:
+            del self._wait_object_index[obj]
+
+        # Move the last entry into the freed slot to keep the list dense.
+        last_index = len(self._wait_objects) - 1
+        last = self._wait_objects.pop()
+        if index < last_index:
+            self._wait_objects[index] = last
+            last_positions = self._wait_object_index[last[0]]
+            last_positions[last_positions.index(last_index)] = index
         self._recreate_wait_objects_array()
 
     def _recreate_wait_objects_array(self):
-        if not self._wait_objects:
-            self._wait_objects_n = 0
-            self._wait_objects_array = None
-            return
+        # The high resolution timer always occupies the first slot.
+        offset = 1 if self._hr_timer else 0
+        count = len(self._wait_objects) + offset
+
+        wait_objects_array = self._wait_objects_array
+        if offset:
+            wait_objects_array[0] = self._hr_timer
+        for i, (o, _) in enumerate(self._wait_objects, offset):
+            wait_objects_array[i] = o
 
-        self._wait_objects_n = len(self._wait_objects)
-        self._wait_objects_array = (HANDLE * self._wait_objects_n)(*[o for o, f in self._wait_objects])
+        self._wait_objects_n = count
 
     def start(self):
         if _kernel32.GetCurrentThreadId() != self._event_thread:
@@ -62,47 +152,104 @@ class Win32EventLoop(PlatformEventLoop):
                                'thread that imports pyglet.app')
 
         self._timer_func = None
+        self._wake_pending = False
 
-        self._winmm.timeBeginPeriod(self._timer_precision)
+        if not self._hr_timer:
+            self._winmm.timeBeginPeriod(self._timer_precision)
 
     def step(self, timeout=None):
-        self.dispatch_posted_events()
+        if self._have_posted_events:
+            self.dispatch_posted_events()
+
+        # The wake-up flag is only a hint: the WM_USER message may have been
+        # removed elsewhere (e.g. by a modal loop or Window.dispatch_events).
+        # Reset it right before waiting. Events posted earlier were dispatched
+        # above, and any later notify() posts a fresh message.
+        self._wake_pending = False
 
-        msg = types.MSG()
+        timer_armed = False
         if timeout is None:
             timeout = constants.INFINITE
+            if self._hr_timer_armed:
+                self._cancel_hr_timer()
+        elif self._hr_timer and timeout > 0:
+            # Negative due time is relative, in 100 nanosecond intervals.
+            # Zero would be an absolute time in the past, so wait at least one.
+            due_time = LARGE_INTEGER(-max(1, int(timeout * 10_000_000)))
+            _SetWaitableTimer(self._hr_timer, ctypes.byref(due_time), 0, None, None, 0)
+            self._hr_timer_armed = timer_armed = True
+            timeout = constants.INFINITE
         else:
-            timeout = int(timeout * 1000)  # milliseconds
+            timeout = max(0, int(timeout * 1000))  # milliseconds
 
-        result = _user32.MsgWaitForMultipleObjects(
+        result = _MsgWaitForMultipleObjectsEx(
             self._wait_objects_n,
             self._wait_objects_array,
-            False,
             timeout,
-            constants.QS_ALLINPUT)
+            constants.QS_ALLINPUT,
+            constants.MWMO_INPUTAVAILABLE)
         result -= constants.WAIT_OBJECT_0
 
+        if self._hr_timer and result == 0:
+            # The high resolution timer expired, same as a wait timeout. Still
+            # pump pending input, so that a timer which keeps expiring cannot
+            # stop messages from being processed.
+            self._hr_timer_armed = False
+            if _GetQueueStatus(constants.QS_ALLINPUT) >> 16:
+                self._dispatch_messages()
+            return False
+
+        if timer_armed:
+            self._cancel_hr_timer()
+
         if result == self._wait_objects_n:
-            while _user32.PeekMessageW(ctypes.byref(msg),
-                                       0, 0, 0, constants.PM_REMOVE):
-                _user32.TranslateMessage(ctypes.byref(msg))
-                _user32.DispatchMessageW(ctypes.byref(msg))
+            self._dispatch_messages()
         elif 0 <= result < self._wait_objects_n:
+            if self._hr_timer:
+                result -= 1
             obj, func = self._wait_objects[result]
             func()
 
         # Return True if timeout was interrupted.
         return result <= self._wait_objects_n
 
+    def _dispatch_messages(self):
+        # Dispatch a bounded number of messages, so that a flood of input
+        # cannot starve the wait objects. Remaining messages make the
+        # next wait return immediately (MWMO_INPUTAVAILABLE).
+        msg = self._msg
+        msg_ref = self._msg_ref
+        for _ in range(self._max_messages_per_step):
+            if not _PeekMessageW(msg_ref, 0, 0, 0, constants.PM_REMOVE):
+                break
+            if msg.message == constants.WM_USER and not msg.hWnd:
+                # The wake-up message from notify() has been consumed.
+                self._wake_pending = False
+            _TranslateMessage(msg_ref)
+            _DispatchMessageW(msg_ref)
+
+    def _cancel_hr_timer(self):
+        _CancelWaitableTimer(self._hr_timer)
+        # Cancelling does not reset the signaled state, so consume a signal
+        # from a deadline that passed before the cancel.
+        _kernel32.WaitForSingleObject(self._hr_timer, 0)
+        self._hr_timer_armed = False
+
     def stop(self):
-        self._winmm.timeEndPeriod(self._timer_precision)
+        if not self._hr_timer:
+            self._winmm.timeEndPeriod(self._timer_precision)
 
     def notify(self):
         # Nudge the event loop with a message it will discard.  Note that only
         # user events are actually posted.  The posted event will not
         # interrupt the window move/size drag loop -- it seems there's no way
         # to do this.
-        _user32.PostThreadMessageW(self._event_thread, constants.WM_USER, 0, 0)
+        # A single pending message is enough to wake the loop, so redundant
+        # notifications between two iterations are dropped.
+        if self._wake_pending:
+            return
+        self._wake_pending = True
+        _PostThreadMessageW(self._event_thread, constants.WM_USER, 0, 0)
 
     def set_timer(self, func, interval):
         if func is None or interval is None:
@@ -110,7 +257,14 @@ class Win32EventLoop(PlatformEventLoop):
         else:
             interval = int(interval * 1000)  # milliseconds
 
+        # The timer is periodic, so it only needs to be reset on changes.
+        # Bound methods are compared by equality, as they are recreated
+        # on every attribute access.
+        if interval == self._timer_interval and func == self._timer_func:
+            return
+
         self._timer_func = func
+        self._timer_interval = interval
         _user32.SetTimer(0, self._timer, interval, self._timer_proc)
 
     def _timer_proc_func(self, hwnd, msg, timer, t):
@@ -69,12 +69,16 @@ _gdi32.SetTextColor.argtypes = [HDC, COLORREF]
 _gdi32.SwapBuffers.restype = BOOL
 _gdi32.SwapBuffers.argtypes = [HDC]
 
+_kernel32.CancelWaitableTimer.restype = BOOL
+_kernel32.CancelWaitableTimer.argtypes = [HANDLE]
 _kernel32.CloseHandle.restype = BOOL
 _kernel32.CloseHandle.argtypes = [HANDLE]
 _kernel32.CreateEventW.restype = HANDLE
 _kernel32.CreateEventW.argtypes = [POINTER(SECURITY_ATTRIBUTES), BOOL, BOOL, c_wchar_p]
 _kernel32.CreateWaitableTimerA.restype = HANDLE
 _kernel32.CreateWaitableTimerA.argtypes = [POINTER(SECURITY_ATTRIBUTES), BOOL, c_char_p]
+_kernel32.CreateWaitableTimerExW.restype = HANDLE
+_kernel32.CreateWaitableTimerExW.argtypes = [POINTER(SECURITY_ATTRIBUTES), c_wchar_p, DWORD, DWORD]
 _kernel32.GetCurrentThreadId.restype = DWORD
 _kernel32.GetCurrentThreadId.argtypes = []
 _kernel32.GetModuleHandleW.restype = HMODULE
@@ -148,6 +152,8 @@ _user32.MapWindowPoints.restype = c_int
 _user32.MapWindowPoints.argtypes = [HWND, HWND, c_void_p, UINT]  # HWND, HWND, LPPOINT, UINT
 _user32.MsgWaitForMultipleObjects.restype = DWORD
 _user32.MsgWaitForMultipleObjects.argtypes = [DWORD, POINTER(HANDLE), BOOL, DWORD, DWORD]
+_user32.MsgWaitForMultipleObjectsEx.restype = DWORD
+_user32.MsgWaitForMultipleObjectsEx.argtypes = [DWORD, POINTER(HANDLE), DWORD, DWORD, DWORD]
 _user32.PeekMessageW.restype = BOOL
 _user32.PeekMessageW.argtypes = [LPMSG, HWND, UINT, UINT, UINT]
 _user32.PostThreadMessageW.restype = BOOL
@@ -3595,6 +3595,7 @@ STATUS_CONTROL_C_EXIT            = -1073741510
 
 
 WAIT_FAILED                      = -1
+MAXIMUM_WAIT_OBJECTS             = 64
 WAIT_OBJECT_0                    = STATUS_WAIT_0 + 0
 
 WAIT_ABANDONED                      = STATUS_ABANDONED_WAIT_0 + 0 
@@ -4975,6 +4976,11 @@ USER_TIMER_MAXIMUM = 0x7fffffff
 # From WinBase.h
 INFINITE = 0xffffffff
 
+# From synchapi.h / winnt.h
+CREATE_WAITABLE_TIMER_MANUAL_RESET = 0x00000001
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+
 # From Winuser.h
 RIDEV_REMOVE = 0x00000001
 RIDEV_EXCLUDE = 0x00000010
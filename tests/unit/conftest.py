@@ -3,8 +3,25 @@ from unittest import mock
 
 from pytest import fixture
 
+from pyglet.graphics import vertexdomain
 
-@fixture
+
+# A named function instead of a lambda for clarity in debugger views.
+def _get_dummy_shader_program(*args, **kwargs):
+    return mock.MagicMock()
+
+
+def _dummy_vertex_list(count, mode, batch=None, group=None, **data):
+    # Initial attribute data is copied into real ctypes arrays, so tests can
+    # read back whatever the code under test writes into them.
+    vertex_list = mock.NonCallableMock()
+    for name, (fmt, initial) in data.items():
+        c_type = vertexdomain._c_types[vertexdomain._gl_types[fmt[0]]]
+        setattr(vertex_list, name, (c_type * len(initial))(*initial))
+    return vertex_list
+
+
+@fixture(scope="session")
 def get_dummy_shader_program():
     """
     Provide a dummy getter to monkeypatch getters for default shaders.
@@ -21,20 +38,33 @@ def get_dummy_shader_program():
 
         # Example from ./shapes/conftest.py
 
-        @fixture(autouse=True)  # Force this to be used for every test in the module
-        def monkeypatch_default_shape_shader(monkeypatch, get_dummy_shader_program):
-            monkeypatch.setattr(
-                'pyglet.shapes.get_default_shader',
-                 get_dummy_shader_program)
+        # Force this to be used for every test in the package. The
+        # patch is applied once and undone when the package finishes.
+        @fixture(scope="package", autouse=True)
+        def monkeypatch_default_shape_shader(get_dummy_shader_program):
+            with MonkeyPatch.context() as monkeypatch:
+                monkeypatch.setattr(
+                    shapes,
+                    'get_default_shader',
+                    get_dummy_shader_program)
+                yield
 
     """
-    # A named function instead of a lambda for clarity in debugger views.
-    def _get_dummy_shader_program(*args, **kwargs):
-        return mock.MagicMock()
-
     return _get_dummy_shader_program
 
 
+@fixture(scope="session")
+def raw_dummy_shader_program():
+    """
+    Provide a mock shader program which creates mock vertex lists.
+
+    Use this when the code under test writes to and reads back from
+    vertex list attributes, such as the color data of a text caret.
+    The program holds no per-test state, so it is shared by the session.
+    """
+    return mock.NonCallableMock(vertex_list=_dummy_vertex_list)
+
+
 # Color constants & fixtures for use with Shapes, UI elements, etc.
 ORIGINAL_RGB_COLOR = 253, 254, 255
 ORIGINAL_RGBA_COLOR = ORIGINAL_RGB_COLOR + (37,)
@@ -52,7 +82,7 @@ def original_rgba_color():
     return ORIGINAL_RGBA_COLOR
 
 
-@fixture(params=[ORIGINAL_RGB_COLOR, ORIGINAL_RGBA_COLOR])
+@fixture(params=[ORIGINAL_RGB_COLOR, ORIGINAL_RGBA_COLOR], ids=["rgb", "rgba"])
 def original_rgb_or_rgba_color(request):
     return request.param
 
@@ -81,9 +111,16 @@ def expected_alpha_for_color(color: Tuple[int, ...]):
         f"Expected color tuple with 3 or 4 elements, but got {color!r}.")
 
 
+# Validated once at import instead of once per parametrized test
+_EXPECTED_ALPHA_FOR_COLOR = {
+    color: expected_alpha_for_color(color)
+    for color in (ORIGINAL_RGB_COLOR, ORIGINAL_RGBA_COLOR, NEW_RGB_COLOR, NEW_RGBA_COLOR)
+}
+
+
 @fixture
 def original_rgb_or_rgba_expected_alpha(original_rgb_or_rgba_color):
-    return expected_alpha_for_color(original_rgb_or_rgba_color)
+    return _EXPECTED_ALPHA_FOR_COLOR[original_rgb_or_rgba_color]
 
 
 @fixture(scope="session")
@@ -96,7 +133,7 @@ def new_rgba_color():
     return NEW_RGBA_COLOR
 
 
-@fixture(params=[NEW_RGB_COLOR, NEW_RGBA_COLOR])
+@fixture(params=[NEW_RGB_COLOR, NEW_RGBA_COLOR], ids=["new_rgb", "new_rgba"])
 def new_rgb_or_rgba_color(request):
     return request.param
 
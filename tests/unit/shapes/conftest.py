@@ -1,7 +1,14 @@
-from pytest import fixture
+from pytest import fixture, MonkeyPatch
 
+from pyglet import shapes
 
-@fixture(autouse=True)
-def monkeypatch_default_shape_shader(monkeypatch, get_dummy_shader_program):
+
+@fixture(scope="package", autouse=True)
+def monkeypatch_default_shape_shader(get_dummy_shader_program):
     """Use a dummy shader when testing non-drawing functionality"""
-    monkeypatch.setattr('pyglet.shapes.get_default_shader', get_dummy_shader_program)
+    # The replacement never changes between tests, so patch once for the
+    # whole package instead of per test. Patching the already imported
+    # module object avoids resolving a dotted path through the import system.
+    with MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(shapes, 'get_default_shader', get_dummy_shader_program)
+        yield